@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Shared n8n Workflow Import
+--------------------------
+Workflow import logic used by import-workflow.py and setup.py:
+1. Reading the importable fields of a workflow export
+2. Building the serialized import payload (cached per file version)
+3. Posting the payload to n8n over a pooled keep-alive session
+
+Run directly with: python -m iwatcher_import
+"""
+
+import json
+import mmap
+import os
+import sys
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Prefer orjson for (de)serializing JSON; fall back to stdlib json
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+
+    def json_pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+except ImportError:
+    def json_loads(data):
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    def json_dumps(obj):
+        # Match orjson's output: compact separators, raw UTF-8
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def json_pretty(obj):
+        return json.dumps(obj, indent=2)
+
+# ijson is optional; it streams very large workflow exports
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+DEFAULT_WORKFLOW_FILE = "iwatcher-gdrive-trigger.json"
+DEFAULT_WORKFLOW_NAME = "iWatcher - Google Drive Auto Trigger"
+WORKFLOW_FIELDS = ("name", "nodes", "connections", "settings")
+STREAMING_THRESHOLD = 10 * 1024 * 1024  # bytes
+
+def build_session(headers):
+    """Create a pooled keep-alive session carrying the given headers"""
+    session = requests.Session()
+    session.headers.update(headers)
+    session.headers["Connection"] = "keep-alive"
+    # Ask for compressed list responses; requests decodes them transparently
+    session.headers["Accept-Encoding"] = requests.utils.DEFAULT_ACCEPT_ENCODING
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def load_workflow_fields(path):
+    """Read only the importable top-level fields of a workflow export"""
+    # Stream huge exports so unused fields (pinData, tags, ...) are never
+    # held in memory alongside the rest of the document
+    if ijson is not None and os.path.getsize(path) > STREAMING_THRESHOLD:
+        with open(path, 'rb') as f:
+            return {
+                key: value
+                for key, value in ijson.kvitems(f, '', use_float=True)
+                if key in WORKFLOW_FIELDS
+            }
+
+    # Parse straight from the page cache rather than copying into a bytes
+    with open(path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+            memoryview(mm) as view:
+        workflow = json_loads(view)
+    return {key: workflow[key] for key in WORKFLOW_FIELDS if key in workflow}
+
+@lru_cache(maxsize=4)
+def _payload_for(path, mtime):
+    """Parse and clean a workflow export; cached per (path, mtime)"""
+    workflow = load_workflow_fields(path)
+
+    # Clean workflow for import (API doesn't accept all export fields)
+    clean_workflow = {
+        "name": workflow.get("name", DEFAULT_WORKFLOW_NAME),
+        "nodes": workflow["nodes"],
+        "connections": workflow["connections"],
+        "settings": workflow.get("settings", {})
+    }
+    return clean_workflow["name"], json_dumps(clean_workflow)
+
+def build_payload(path=DEFAULT_WORKFLOW_FILE):
+    """Return (name, payload_bytes) for a workflow file, reparsing only on change"""
+    return _payload_for(str(path), os.path.getmtime(path))
+
+def import_workflow(session, n8n_url, payload_bytes):
+    """POST a serialized workflow payload to n8n and return the response"""
+    # The body is pre-serialized bytes, so requests won't set the type itself
+    return session.post(
+        f"{n8n_url.rstrip('/')}/api/v1/workflows",
+        data=payload_bytes,
+        headers={"Content-Type": "application/json"}
+    )
+
+def main():
+    # Load environment variables
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass  # dotenv is optional
+
+    # Get configuration from environment
+    n8n_url = os.getenv("N8N_URL", "http://localhost:5678")
+    api_key = os.getenv("N8N_API_KEY")
+
+    if not api_key:
+        print("❌ Error: N8N_API_KEY environment variable not set!")
+        print("   Set it with: export N8N_API_KEY='your_api_key'")
+        print("   Or add to .env file: N8N_API_KEY=your_key")
+        print("   Get API key from n8n UI: Settings → API → Create API Key")
+        sys.exit(1)
+
+    session = build_session({
+        "X-N8N-API-KEY": api_key,
+        "Content-Type": "application/json",
+        "Accept": "application/json"
+    })
+
+    _, payload = build_payload()
+    response = import_workflow(session, n8n_url, payload)
+
+    if response.status_code in [200, 201]:
+        result = json_loads(response.content)
+        print(f"✅ Workflow imported successfully!")
+        print(f"   ID: {result.get('id')}")
+        print(f"   Name: {result.get('name')}")
+    else:
+        print(f"❌ Failed to import workflow: {response.status_code}")
+        print(f"   Response: {response.text}")
+
+if __name__ == "__main__":
+    main()
@@ -10,11 +10,18 @@ Handles:
 """
 
 import os
-import json
-import requests
 import sys
 from pathlib import Path
 
+from iwatcher_import import (
+    DEFAULT_WORKFLOW_FILE,
+    build_payload,
+    build_session,
+    import_workflow as post_workflow,
+    json_dumps,
+    json_loads,
+)
+
 # Load environment variables
 try:
     from dotenv import load_dotenv
@@ -28,21 +35,24 @@ class N8NSetup:
         self.api_key = api_key
         self.headers = {
             "X-N8N-API-KEY": api_key,
-            "Content-Type": "application/json"
+            "Content-Type": "application/json",
+            "Accept": "application/json"
         }
 
+        # Reuse keep-alive connections across API calls
+        self.session = build_session(self.headers)
+
     def test_connection(self):
         """Test n8n API connectivity"""
         print("🔍 Testing n8n connection...")
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.n8n_url}/api/v1/workflows",
-                headers=self.headers,
                 timeout=10
             )
             if response.status_code == 200:
                 print(f"✅ Connected to n8n successfully")
-                print(f"   Found {len(response.json()['data'])} existing workflows")
+                print(f"   Found {len(json_loads(response.content)['data'])} existing workflows")
                 return True
             else:
                 print(f"❌ Connection failed: {response.status_code}")
@@ -62,15 +72,14 @@ class N8NSetup:
             "NOTION_DATABASE_ID"
         ]
 
-        missing = []
-        for var in required_vars:
-            value = os.getenv(var)
-            if not value:
-                missing.append(var)
-                print(f"   ❌ {var}: Not set")
-            else:
-                masked = value[:8] + "..." if len(value) > 8 else "***"
-                print(f"   ✅ {var}: {masked}")
+        # Look each variable up once, then report them in a single write
+        values = {var: os.environ.get(var) for var in required_vars}
+        missing = [var for var, value in values.items() if not value]
+        print("\n".join(
+            f"   ✅ {var}: {value[:8] + '...' if len(value) > 8 else '***'}"
+            if value else f"   ❌ {var}: Not set"
+            for var, value in values.items()
+        ))
 
         if missing:
             print(f"\n⚠️  Missing variables: {', '.join(missing)}")
@@ -80,7 +89,7 @@ class N8NSetup:
         print("✅ All environment variables configured")
         return True
 
-    def import_workflow(self, workflow_file="iwatcher-gdrive-trigger.json"):
+    def import_workflow(self, workflow_file=DEFAULT_WORKFLOW_FILE):
         """Import workflow from JSON file"""
         print(f"\n📥 Importing workflow from {workflow_file}...")
 
@@ -88,30 +97,17 @@ class N8NSetup:
             print(f"❌ Workflow file not found: {workflow_file}")
             return None
 
-        with open(workflow_file, 'r') as f:
-            workflow = json.load(f)
-
-        # Clean workflow for import (API doesn't accept all export fields)
-        clean_workflow = {
-            "name": workflow.get("name", "iWatcher - Google Drive Auto Trigger"),
-            "nodes": workflow["nodes"],
-            "connections": workflow["connections"],
-            "settings": workflow.get("settings", {})
-        }
+        workflow_name, payload = build_payload(workflow_file)
 
         try:
-            response = requests.post(
-                f"{self.n8n_url}/api/v1/workflows",
-                headers=self.headers,
-                json=clean_workflow
-            )
+            response = post_workflow(self.session, self.n8n_url, payload)
 
             if response.status_code in [200, 201]:
-                workflow_data = response.json()
+                workflow_data = json_loads(response.content)
                 workflow_id = workflow_data.get('data', {}).get('id') or workflow_data.get('id')
                 print(f"✅ Workflow imported successfully")
                 print(f"   ID: {workflow_id}")
-                print(f"   Name: {clean_workflow['name']}")
+                print(f"   Name: {workflow_name}")
                 return workflow_id
             else:
                 print(f"❌ Import failed: {response.status_code}")
@@ -126,10 +122,9 @@ class N8NSetup:
         print(f"\n▶️  Activating workflow {workflow_id}...")
 
         try:
-            response = requests.patch(
+            response = self.session.patch(
                 f"{self.n8n_url}/api/v1/workflows/{workflow_id}",
-                headers=self.headers,
-                json={"active": True}
+                data=json_dumps({"active": True})
             )
 
             if response.status_code == 200:
@@ -147,13 +142,12 @@ class N8NSetup:
         """List all workflows"""
         print("\n📋 Current workflows:")
         try:
-            response = requests.get(
-                f"{self.n8n_url}/api/v1/workflows",
-                headers=self.headers
+            response = self.session.get(
+                f"{self.n8n_url}/api/v1/workflows"
             )
 
             if response.status_code == 200:
-                workflows = response.json()['data']
+                workflows = json_loads(response.content)['data']
                 for wf in workflows:
                     status = "🟢 Active" if wf.get('active') else "⚪ Inactive"
                     print(f"   {status} | {wf['id']} | {wf['name']}")